@@ -1,4 +1,4 @@
-from .core import load, loads, dump, dumps
+from .core import load, loads, loads_bytes, dump, dumps, loads_dict_encoded, dumps_dict_encoded
 from .reader import Reader
 from .writer import Writer
 
@@ -1,11 +1,41 @@
-from typing import Iterable, List
+import io
+import mmap
+import os
+from typing import Iterable, List, Tuple
 
 from .reader import Reader
 from .writer import Writer
 
+_unescape = Reader.unescape
+
+_MMAP_THRESHOLD = 1 << 20
+
 def load(file_obj) -> List[List[str]]:
-    """Load NSV data from a file-like object."""
-    return loads(file_obj.read())
+    """Load NSV data from a file-like object, text or binary (UTF-8)."""
+    # Only a plain OS file has fileno/tell/size describing the bytes read() returns;
+    # compressing wrappers (gzip, bz2, lzma) report the underlying compressed file
+    if isinstance(getattr(file_obj, 'raw', file_obj), io.FileIO):
+        return loads(_read_utf8(file_obj))
+    data = file_obj.read()
+    if isinstance(data, str):
+        return loads(data)
+    return loads_bytes(data)
+
+def _read_utf8(file_obj) -> str:
+    """Read the rest of a binary OS file, decoding large ones straight off a memory map."""
+    try:
+        fileno = file_obj.fileno()
+        start = file_obj.tell()
+        size = os.fstat(fileno).st_size
+    except (OSError, AttributeError, io.UnsupportedOperation):
+        return str(file_obj.read(), 'utf-8')
+    if size - start < _MMAP_THRESHOLD:
+        return str(file_obj.read(), 'utf-8')
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm)[start:] as view:
+            s = str(view, 'utf-8')
+    file_obj.seek(size)
+    return s
 
 def loads(s: str) -> List[List[str]]:
     """Load NSV data from a string."""
@@ -18,12 +48,23 @@ def loads(s: str) -> List[List[str]]:
         if line == '':
             data.append(row)
             row = []
+        elif '\\' in line:
+            row.append(_unescape(line))
         else:
-            row.append(Reader.unescape(line))
+            row.append(line)  # cheaper than calling _unescape just to get line back
     if row:
         data.append(row)
     return data
 
+def loads_bytes(b) -> List[List[str]]:
+    """Load NSV data from UTF-8 encoded bytes or any other bytes-like object."""
+    if not isinstance(b, bytes):
+        b = bytes(memoryview(b))  # the Rust backend only takes bytes
+    return _loads_utf8(b)
+
+def _loads_utf8(b: bytes) -> List[List[str]]:
+    return loads(str(b, 'utf-8'))
+
 def dump(data: Iterable[Iterable[str]], file_obj):
     """Write elements to an NSV file."""
     Writer(file_obj).write_rows(data)
@@ -31,17 +72,60 @@ def dump(data: Iterable[Iterable[str]], file_obj):
 
 def dumps(data: Iterable[Iterable[str]]) -> str:
     """Write elements to an NSV string."""
-    lines = []
+    return dump(data, io.StringIO()).getvalue()
+
+def loads_dict_encoded(s: str) -> Tuple[List[List[int]], List[str]]:
+    """Load NSV data from a string as codes into a vocabulary of distinct cells.
+
+    Each distinct cell is unescaped and stored once, which pays off on
+    columns with heavily repeated values.
+    """
+    codes = {}  # escaped line -> code, so repeats skip unescaping
+    value_codes = {}  # unescaped value -> code, so vocab stays distinct
+    vocab = []
+    data = []
+    row = []
+    lines = s.split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    for line in lines:
+        if line == '':
+            data.append(row)
+            row = []
+        else:
+            code = codes.get(line)
+            if code is None:
+                value = _unescape(line)
+                code = value_codes.get(value)
+                if code is None:
+                    code = value_codes[value] = len(vocab)
+                    vocab.append(value)
+                codes[line] = code
+            row.append(code)
+    if row:
+        data.append(row)
+    return data, vocab
+
+def dumps_dict_encoded(data: Iterable[Iterable[int]], vocab: List[str]) -> str:
+    """Write codes into a vocabulary to an NSV string, escaping each distinct cell once."""
+    escaped = [Writer.escape(value) for value in vocab]
+    chunks = []
     for row in data:
-        for cell in row:
-            lines.append(Writer.escape(cell))
-        lines.append('')
-    return ''.join(f'{line}\n' for line in lines)
+        cells = [escaped[code] for code in row]
+        chunks.append('\n'.join(cells) + '\n\n' if cells else '\n')
+    return ''.join(chunks)
 
 # Try to use fast Rust implementation if available
 try:
     from ._rust import loads as _loads_rs, dumps as _dumps_rs
     loads = _loads_rs
     dumps = _dumps_rs
+    USING_RUST = True
+except ImportError:
+    USING_RUST = False
+
+# Extensions built before loads_bytes existed keep the Rust loads/dumps above
+try:
+    from ._rust import loads_bytes as _loads_utf8
 except ImportError:
     pass
@@ -5,6 +5,9 @@ from typing import List, Iterable
 from .reader import Reader as NSVReader
 from .writer import Writer as NSVWriter
 
+_escape = NSVWriter.escape
+_unescape = NSVReader.unescape
+
 
 def lift(seqseq: Iterable[Iterable[str]]) -> List[str]:
     """
@@ -20,7 +23,7 @@ def lift(seqseq: Iterable[Iterable[str]]) -> List[str]:
         if not first:
             result.append('')
         for cell in row:
-            result.append(NSVWriter.escape(cell))
+            result.append(_escape(cell))
         first = False
     return result
 
@@ -38,11 +41,13 @@ def unlift(seq: Iterable[str]) -> List[List[str]]:
     rows = []
     row = []
     for element in seq:
-        if element != '':
-            row.append(NSVReader.unescape(element))
-        else:
+        if element == '':
             rows.append(row)
             row = []
+        elif '\\' in element:
+            row.append(_unescape(element))
+        else:
+            row.append(element)  # lift output without a backslash was never escaped
     rows.append(row)
     return rows
 
@@ -1,3 +1,20 @@
+from functools import lru_cache
+
+
+def _unescape_special(s):
+    # split pairs up '\\\\' leftmost-first, like a left-to-right scan would,
+    # so any backslash left inside a part escapes the character after it
+    parts = s.split('\\\\')
+    if parts[-1].endswith('\\'):  # dangling escape at the very end
+        parts[-1] = parts[-1][:-1]
+    return '\\'.join([part.replace('\\n', '\n') for part in parts])  # other escapes kept as-is, sus
+
+
+# A hit is ~10x cheaper than the split/replace decode, a miss costs ~1/3 extra;
+# short escaped cells tend to repeat (categorical columns), so they go through the cache
+_unescape_short = lru_cache(maxsize=2048)(_unescape_special)
+
+
 class Reader:
     def __init__(self, file_obj):
         self._file_obj = file_obj
@@ -28,23 +45,7 @@ class Reader:
             return ''
         if '\\' not in s:
             return s
-        out = []
-        escaped = False
-        for c in s:
-            if escaped:
-                if c == 'n':
-                    out.append('\n')
-                elif c == '\\':
-                    out.append('\\')
-                else:
-                    out.append('\\' + c)  # sus
-                escaped = False
-            else:
-                if c == '\\':
-                    escaped = True
-                else:
-                    out.append(c)
-        return ''.join(out)
+        return _unescape_short(s) if len(s) <= 64 else _unescape_special(s)
 
     @staticmethod
     def check(s: str):
@@ -5,15 +5,18 @@ from .reader import Reader
 
 T = TypeVar('T')
 
+_escape = Writer.escape
+_unescape = Reader.unescape
+
 
 def escape_seqseq(seqseq: Iterable[Iterable[str]]) -> List[List[str]]:
     """Apply NSV escaping at depth 2: map(map(escape))."""
-    return [[Writer.escape(cell) for cell in row] for row in seqseq]
+    return [[_escape(cell) for cell in row] for row in seqseq]
 
 
 def unescape_seqseq(seqseq: Iterable[Iterable[str]]) -> List[List[str]]:
     """Apply NSV unescaping at depth 2: map(map(unescape))."""
-    return [[Reader.unescape(cell) for cell in row] for row in seqseq]
+    return [[_unescape(cell) for cell in row] for row in seqseq]
 
 
 def spill(seqseq: Iterable[Iterable[T]], marker: T) -> List[T]:
@@ -25,8 +28,7 @@ def spill(seqseq: Iterable[Iterable[T]], marker: T) -> List[T]:
     """
     seq = []
     for row in seqseq:
-        for item in row:
-            seq.append(item)
+        seq.extend(row)
         seq.append(marker)
     return seq
 
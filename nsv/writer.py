@@ -1,18 +1,42 @@
 from typing import Iterable
 
+_ROWS_PER_WRITE = 512
+
 class Writer:
     def __init__(self, file_obj):
         self._file_obj = file_obj
 
     def write_row(self, row: Iterable[str]):
-        if row:
-            chunk = ''.join(f'{Writer.escape(cell)}\n' for cell in row)
-            self._file_obj.write(chunk)
-        self._file_obj.write('\n')
+        self._file_obj.write(Writer.encode_row(row))
 
     def write_rows(self, rows: Iterable[Iterable[str]]):
-        for row in rows:
-            self.write_row(row)
+        # One write per batch of joined rows, much cheaper than a write per row
+        batch = []
+        try:
+            for row in rows:
+                batch.append(Writer.encode_row(row))
+                if len(batch) == _ROWS_PER_WRITE:
+                    self._file_obj.write(''.join(batch))
+                    batch = []
+        finally:
+            # Rows encoded before an error in rows (or in a later row) still get written
+            if batch:
+                self._file_obj.write(''.join(batch))
+
+    @staticmethod
+    def encode_row(row: Iterable[str]) -> str:
+        """Encode a single row, including the empty line terminating it."""
+        if not isinstance(row, (list, tuple)):
+            row = list(row)
+        if not row:
+            return '\n'
+        chunk = '\n'.join(row)
+        # A clean row needs no escaping at all, only its empty cells need the marker
+        if '\\' in chunk or chunk.count('\n') != len(row) - 1:
+            chunk = '\n'.join(map(Writer.escape, row))
+        elif '' in row:
+            chunk = '\n'.join([cell or '\\' for cell in row])
+        return chunk + '\n\n'
 
     @staticmethod
     def escape(s):
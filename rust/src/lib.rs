@@ -1,12 +1,11 @@
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::PyList;
 
-/// Parse NSV string into a list of lists of str
-#[pyfunction]
-fn loads<'py>(py: Python<'py>, s: &str) -> PyResult<Bound<'py, PyList>> {
-    let data = nsv::decode(s);
-
-    // Convert Vec<Vec<String>> to Python list of lists
+/// Convert Vec<Vec<String>> to Python list of lists
+///
+/// Callers parse with the GIL released and only take it back for this part.
+fn to_pylist<'py>(py: Python<'py>, data: Vec<Vec<String>>) -> PyResult<Bound<'py, PyList>> {
     let result = PyList::empty(py);
     for row in data {
         let py_row = PyList::empty(py);
@@ -15,21 +14,36 @@ fn loads<'py>(py: Python<'py>, s: &str) -> PyResult<Bound<'py, PyList>> {
         }
         result.append(py_row)?;
     }
-
     Ok(result)
 }
 
+/// Parse NSV string into a list of lists of str
+#[pyfunction]
+fn loads<'py>(py: Python<'py>, s: &str) -> PyResult<Bound<'py, PyList>> {
+    let data = py.detach(|| nsv::decode(s));
+    to_pylist(py, data)
+}
+
+/// Parse UTF-8 encoded NSV bytes into a list of lists of str
+#[pyfunction]
+fn loads_bytes<'py>(py: Python<'py>, b: &[u8]) -> PyResult<Bound<'py, PyList>> {
+    let data = py
+        .detach(|| std::str::from_utf8(b).map(nsv::decode))
+        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+    to_pylist(py, data)
+}
+
 /// Serialize data to NSV string
 #[pyfunction]
-fn dumps(data: Vec<Vec<String>>) -> PyResult<String> {
-    Ok(nsv::encode(&data))
+fn dumps(py: Python<'_>, data: Vec<Vec<String>>) -> PyResult<String> {
+    Ok(py.detach(|| nsv::encode(&data)))
 }
 
 /// A Python module implemented in Rust.
 #[pymodule]
 fn _rust(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(loads, m)?)?;
+    m.add_function(wrap_pyfunction!(loads_bytes, m)?)?;
     m.add_function(wrap_pyfunction!(dumps, m)?)?;
     Ok(())
 }
-
@@ -1,8 +1,13 @@
+import functools
+import gc
 import time
 import csv
 import io
+import itertools
 import random
 import string
+from concurrent.futures import ProcessPoolExecutor
+
 import nsv
 
 
@@ -11,34 +16,64 @@ def generate_random_string(length=10):
     return ''.join(random.choices(string.ascii_letters, k=length))
 
 
-def create_test_data(rows, cols):
+def create_test_data(rows, cols, length=10):
     """Create test data with the specified number of rows and columns."""
-    return [[generate_random_string() for _ in range(cols)] for _ in range(rows)]
+    # One bulk draw instead of a random.choices call per cell
+    chars = ''.join(random.choices(string.ascii_letters, k=rows * cols * length))
+    cells = [chars[i:i + length] for i in range(0, len(chars), length)]
+    return [cells[r * cols:(r + 1) * cols] for r in range(rows)]
+
+
+def best_time(func, make_arg, iterations=5):
+    """Return the fastest of `iterations` runs of func(make_arg()), in seconds.
+
+    The argument is built outside the timed region, and GC is paused while
+    sampling so collection pauses don't land in the measurements.
+    """
+    timings = []
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            arg = make_arg()
+            start_time = time.perf_counter_ns()
+            func(arg)
+            timings.append(time.perf_counter_ns() - start_time)
+    finally:
+        if was_enabled:
+            gc.enable()
+    return min(timings) / 1e9
+
+
+def generate_datasets(generator, specs, chunk_rows=10000):
+    """Build one dataset per (rows, cols, ...) tuple in `specs`, in worker processes.
+
+    Rows are independent, so each dataset is generated in chunks of at most
+    `chunk_rows` rows and stitched back together, letting the largest
+    datasets spread across workers too. Only generation is parallel;
+    timing still runs serially so samples don't compete for cores.
+    """
+    jobs = []
+    bounds = []
+    for rows, *args in specs:
+        first = len(jobs)
+        for offset in range(0, rows, chunk_rows):
+            jobs.append((min(chunk_rows, rows - offset), *args))
+        bounds.append((first, len(jobs)))
+    # Reseed per worker, forked workers would otherwise share one random state
+    with ProcessPoolExecutor(initializer=random.seed) as executor:
+        parts = list(executor.map(generator, *zip(*jobs)))
+    return [list(itertools.chain.from_iterable(parts[a:b])) for a, b in bounds]
 
 
 def benchmark_csv_write(data, iterations=5):
     """Benchmark CSV writing performance."""
-    total_time = 0
-    for _ in range(iterations):
-        output = io.StringIO()
-        start_time = time.time()
-        writer = csv.writer(output)
-        writer.writerows(data)
-        end_time = time.time()
-        total_time += (end_time - start_time)
-    return total_time / iterations
+    return best_time(lambda output: csv.writer(output).writerows(data), io.StringIO, iterations)
 
 
 def benchmark_nsv_write(data, iterations=5):
     """Benchmark NSV writing performance."""
-    total_time = 0
-    for _ in range(iterations):
-        output = io.StringIO()
-        start_time = time.time()
-        nsv.dump(data, output)
-        end_time = time.time()
-        total_time += (end_time - start_time)
-    return total_time / iterations
+    return best_time(functools.partial(nsv.dump, data), io.StringIO, iterations)
 
 
 def benchmark_csv_read(data, iterations=5):
@@ -49,15 +84,7 @@ def benchmark_csv_read(data, iterations=5):
     writer.writerows(data)
     csv_string = output.getvalue()
 
-    total_time = 0
-    for _ in range(iterations):
-        input_file = io.StringIO(csv_string)
-        start_time = time.time()
-        reader = csv.reader(input_file)
-        rows = list(reader)
-        end_time = time.time()
-        total_time += (end_time - start_time)
-    return total_time / iterations
+    return best_time(lambda input_file: list(csv.reader(input_file)), functools.partial(io.StringIO, csv_string), iterations)
 
 
 def benchmark_nsv_read(data, iterations=5):
@@ -67,14 +94,7 @@ def benchmark_nsv_read(data, iterations=5):
     nsv.dump(data, output)
     nsv_string = output.getvalue()
 
-    total_time = 0
-    for _ in range(iterations):
-        input_file = io.StringIO(nsv_string)
-        start_time = time.time()
-        rows = nsv.load(input_file)
-        end_time = time.time()
-        total_time += (end_time - start_time)
-    return total_time / iterations
+    return best_time(nsv.load, functools.partial(io.StringIO, nsv_string), iterations)
 
 
 def run_benchmarks():
@@ -88,10 +108,10 @@ def run_benchmarks():
     ]
 
     results = []
+    datasets = generate_datasets(create_test_data, test_sizes)
 
-    for rows, cols in test_sizes:
+    for (rows, cols), data in zip(test_sizes, datasets):
         print(f"Benchmarking {rows}x{cols} dataset...")
-        data = create_test_data(rows, cols)
 
         # Writing benchmarks
         csv_write_time = benchmark_csv_write(data)
@@ -121,26 +141,24 @@ def run_benchmarks():
 
 def generate_complex_data(rows, cols, multiline_prob=0.1, long_text_prob=0.1):
     """Generate test data with occasional multiline text and long values."""
-    data = []
+    rand, randint, gen = random.random, random.randint, generate_random_string
+    data = [None] * rows
     for i in range(rows):
-        row = []
+        row = [None] * cols
         for j in range(cols):
             # Decide what type of data to generate
-            if random.random() < multiline_prob:
-                # Generate text with embedded newlines (which CSV would need to escape)
-                lines = random.randint(2, 4)
-                value = '\n'.join(generate_random_string(random.randint(5, 15))
-                                  for _ in range(lines))
-                # For CSV, we'd need to escape this; for NSV, we sanitize newlines
-                value = value.replace('\n', '\\n')  # Sanitize for NSV
-            elif random.random() < long_text_prob:
+            if rand() < multiline_prob:
+                # Generate text with embedded newlines (which CSV would need to escape);
+                # for NSV, we sanitize newlines by joining on the escaped form directly
+                value = '\\n'.join(gen(randint(5, 15)) for _ in range(randint(2, 4)))
+            elif rand() < long_text_prob:
                 # Generate long text
-                value = generate_random_string(random.randint(100, 500))
+                value = gen(randint(100, 500))
             else:
                 # Generate regular text
-                value = generate_random_string(random.randint(5, 20))
-            row.append(value)
-        data.append(row)
+                value = gen(randint(5, 20))
+            row[j] = value
+        data[i] = row
     return data
 
 
@@ -155,10 +173,10 @@ def run_complex_benchmarks():
     ]
 
     results = []
+    datasets = generate_datasets(generate_complex_data, [case[1:] for case in test_cases])
 
-    for name, rows, cols, multiline_prob, long_text_prob in test_cases:
+    for (name, rows, cols, _, _), data in zip(test_cases, datasets):
         print(f"Benchmarking {name} dataset ({rows}x{cols})...")
-        data = generate_complex_data(rows, cols, multiline_prob, long_text_prob)
 
         # Writing benchmarks
         csv_write_time = benchmark_csv_write(data)
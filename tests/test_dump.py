@@ -1,35 +1,61 @@
-import os
 import unittest
 from io import StringIO
 
 import nsv
-from test_utils import SAMPLES_DATA, dump_sample, dumps_sample, SAMPLES_DIR
+from test_utils import SAMPLES_DATA, SAMPLES_TEXT, dump_sample, dumps_sample
 
 
 class TestDump(unittest.TestCase):
     def test_dump(self):
         for name in SAMPLES_DATA:
             with self.subTest(name=name):
-                actual = dump_sample(name)
-                file_path = os.path.join(SAMPLES_DIR, f'{name}.nsv')
-                with open(file_path, 'r') as f:
-                    expected = f.read()
-                self.assertEqual(expected, actual)
+                self.assertEqual(SAMPLES_TEXT[name], dump_sample(name))
 
     def test_dumps(self):
         for name in SAMPLES_DATA:
             with self.subTest(name=name):
-                actual = dumps_sample(name)
-                file_path = os.path.join(SAMPLES_DIR, f'{name}.nsv')
-                with open(file_path, 'r') as f:
-                    expected = f.read()
-                self.assertEqual(expected, actual)
+                self.assertEqual(SAMPLES_TEXT[name], dumps_sample(name))
+
+    def test_dumps_dict_encoded(self):
+        for name, data in SAMPLES_DATA.items():
+            with self.subTest(name=name):
+                vocab = sorted({cell for row in data for cell in row})
+                codes = [[vocab.index(cell) for cell in row] for row in data]
+                self.assertEqual(SAMPLES_TEXT[name], nsv.dumps_dict_encoded(codes, vocab))
 
     def test_parity(self):
         for name, data in SAMPLES_DATA.items():
             with self.subTest(name=name):
                 self.assertEqual(nsv.dumps(data), nsv.dump(data, StringIO()).getvalue())
 
+    def test_write_rows_batches(self):
+        """Rows written in batches come out the same as rows written one by one."""
+        data = [[f'r{i}', '', 'x\ny'] if i % 3 else [] for i in range(1500)]
+        expected = StringIO()
+        writer = nsv.Writer(expected)
+        for row in data:
+            writer.write_row(row)
+        self.assertEqual(expected.getvalue(), nsv.dump(iter(data), StringIO()).getvalue())
+
+    def test_write_rows_error_mid_batch(self):
+        """Rows taken before an error are written, not dropped with the batch."""
+        def rows(n):
+            for i in range(n):
+                yield [f'r{i}', '']
+            raise RuntimeError('source failed')
+
+        for n in (2, 600):
+            with self.subTest(rows=n):
+                output = StringIO()
+                with self.assertRaises(RuntimeError):
+                    nsv.dump(rows(n), output)
+                self.assertEqual([[f'r{i}', ''] for i in range(n)], nsv.loads(output.getvalue()))
+
+        output = StringIO()
+        with self.assertRaises(TypeError):
+            nsv.dump([['a', 'b'], ['c'], ['d', 1]], output)
+        self.assertEqual('a\nb\n\nc\n\n', output.getvalue())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,18 +1,25 @@
 import unittest
+import itertools
 import os
+from io import StringIO
+
 import nsv
 from test_utils import SAMPLES_DIR, SAMPLES_DATA, dump_then_load
 
+# Skip surrogates (0xD800-0xDFFF): not valid UTF-8, not a use case for NSV.
+LONG_STRING = ''.join(map(chr, itertools.chain(range(11, 0xD800), range(0xE000, 0x110000))))
+
+TRAILING_BACKSLASH_DATA = [
+    ['yo', 'shouln\'ta', 'be', 'doing', 'this'],
+    ['', 'or', '', 'should', '', 'ya'],
+]
+
 class TestEdgeCases(unittest.TestCase):
     def test_long_strings(self):
         """Test handling of long string values."""
-        # Skip surrogates (0xD800-0xDFFF): not valid UTF-8, not a use case for NSV.
-        long_string = ''.join(
-            chr(x) for x in range(11, 0x110000) if not (0xD800 <= x <= 0xDFFF)
-        )
         data = [
-            ["normal", long_string],
-            [long_string, "normal"]
+            ["normal", LONG_STRING],
+            [LONG_STRING, "normal"]
         ]
         self.assertEqual(data, dump_then_load(data))
 
@@ -25,14 +32,33 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_trailing_backslash(self):
         """Test handling of special characters in field values."""
-        expected = [
-            ['yo', 'shouln\'ta', 'be', 'doing', 'this'],
-            ['', 'or', '', 'should', '', 'ya'],
-        ]
         file_path = os.path.join(SAMPLES_DIR, 'trailing_backslash.nsv')
         with open(file_path, 'r') as f:
             rows = nsv.load(f)
-        self.assertEqual(expected, rows)
+        self.assertEqual(TRAILING_BACKSLASH_DATA, rows)
+
+    def test_unescape_lenient(self):
+        """Unknown escapes are kept verbatim, a dangling backslash is dropped."""
+        cases = [
+            ('a\\x', 'a\\x'),
+            ('ab\\', 'ab'),
+            ('\\\\\\n', '\\\n'),
+            ('\\\\\\', '\\'),
+            ('\\\nb', '\\\nb'),
+            ('a\\\\nb\\nc', 'a\\nb\nc'),
+        ]
+        for s, expected in cases:
+            with self.subTest(s=s):
+                self.assertEqual(expected, nsv.Reader.unescape(s))
+
+    def test_sentinel_like_characters(self):
+        """NUL and private-use code points are ordinary data, escaped or not."""
+        data = [
+            ['\x00', 'a\x00\\b', '\x00\n\x00'],
+            ['\ue000', '', '\\\ue000', '\ue000\\n'],
+        ]
+        self.assertEqual(data, dump_then_load(data))
+        self.assertEqual(data, list(nsv.Reader(StringIO(nsv.dumps(data)))))
 
     # def test_numeric_values(self):
     #     """Test handling of numeric values."""
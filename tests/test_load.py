@@ -1,9 +1,18 @@
 import unittest
+import gzip
+import importlib.util
+import io
 import os
+import random
+import sys
+import tarfile
+import tempfile
+import types
+from unittest import mock
 from io import StringIO
 
 import nsv
-from test_utils import SAMPLES_DIR, SAMPLES_DATA, load_sample, loads_sample
+from test_utils import SAMPLES_DIR, SAMPLES_DATA, SAMPLES_TEXT, load_sample, loads_sample
 
 
 class TestLoad(unittest.TestCase):
@@ -19,13 +28,128 @@ class TestLoad(unittest.TestCase):
                 actual = loads_sample(name)
                 self.assertEqual(expected, actual)
 
-    def test_parity(self):
-        for name in SAMPLES_DATA:
+    def test_loads_bytes(self):
+        for name, expected in SAMPLES_DATA.items():
+            with self.subTest(sample_name=name):
+                file_path = os.path.join(SAMPLES_DIR, f'{name}.nsv')
+                with open(file_path, 'rb') as f:
+                    actual = nsv.loads_bytes(f.read())
+                self.assertEqual(expected, actual)
+
+    def test_loads_bytes_like(self):
+        for name, expected in SAMPLES_DATA.items():
+            payload = SAMPLES_TEXT[name].encode('utf-8')
+            for b in (bytearray(payload), memoryview(payload)):
+                with self.subTest(sample_name=name, type=type(b).__name__):
+                    # Whichever backend is loaded only ever sees bytes
+                    with mock.patch.object(nsv.core, '_loads_utf8', wraps=nsv.core._loads_utf8) as backend:
+                        self.assertEqual(expected, nsv.loads_bytes(b))
+                    self.assertIs(bytes, type(backend.call_args.args[0]))
+
+    def test_loads_bytes_rejects(self):
+        for b in ('a\n\n', 3, None):
+            with self.subTest(b=b):
+                with self.assertRaises(TypeError):
+                    nsv.loads_bytes(b)
+        with self.assertRaises(ValueError):
+            nsv.loads_bytes(b'\xff\n\n')
+
+    @unittest.skipUnless(nsv.core.USING_RUST, 'Rust extension not built')
+    def test_loads_bytes_rust(self):
+        from nsv._rust import loads_bytes as loads_bytes_rs
+        for name, expected in SAMPLES_DATA.items():
+            with self.subTest(sample_name=name):
+                self.assertEqual(expected, loads_bytes_rs(SAMPLES_TEXT[name].encode('utf-8')))
+                self.assertEqual(expected, nsv.loads_bytes(bytearray(SAMPLES_TEXT[name], 'utf-8')))
+
+    def test_stale_rust_without_loads_bytes(self):
+        """An extension built before loads_bytes still provides the Rust loads/dumps."""
+        stale = types.ModuleType('nsv._rust')
+        stale.loads = mock.Mock(return_value=[['rs']])
+        stale.dumps = mock.Mock(return_value='rs\n\n')
+        spec = importlib.util.spec_from_file_location('nsv._core_stale', nsv.core.__file__)
+        core = importlib.util.module_from_spec(spec)
+        with mock.patch.dict(sys.modules, {'nsv._rust': stale}):
+            spec.loader.exec_module(core)
+        self.assertTrue(core.USING_RUST)
+        self.assertIs(stale.loads, core.loads)
+        self.assertIs(stale.dumps, core.dumps)
+        self.assertEqual([['rs']], core.loads_bytes(bytearray(b'a\n\n')))
+        stale.loads.assert_called_once_with('a\n\n')
+
+    def test_load_binary(self):
+        for name, expected in SAMPLES_DATA.items():
             with self.subTest(sample_name=name):
                 file_path = os.path.join(SAMPLES_DIR, f'{name}.nsv')
-                with open(file_path, 'r') as f:
-                    s = f.read()
-                    self.assertEqual(nsv.loads(s), nsv.load(StringIO(s)))
+                with open(file_path, 'rb') as f:
+                    self.assertEqual(expected, nsv.load(f))
+
+    def test_load_binary_tempfile(self):
+        """Binary file objects outside the io ABCs (tempfile wrappers) are decoded too."""
+        for make in (tempfile.NamedTemporaryFile, tempfile.SpooledTemporaryFile):
+            for name, expected in SAMPLES_DATA.items():
+                with self.subTest(type=make.__name__, sample_name=name):
+                    with make() as f:
+                        f.write(SAMPLES_TEXT[name].encode('utf-8'))
+                        f.seek(0)
+                        self.assertEqual(expected, nsv.load(f))
+
+    def test_load_binary_mmap(self):
+        data = [[f'r{i}c1', f'line\nbreak {i}', '', 'back\\slash ☃'] for i in range(50000)]
+        with tempfile.TemporaryDirectory() as output_dir:
+            file_path = os.path.join(output_dir, 'large.nsv')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write('skipped\n\n')
+                nsv.dump(data, f)
+            self.assertGreater(os.path.getsize(file_path), nsv.core._MMAP_THRESHOLD)
+            with open(file_path, 'rb') as f:
+                f.readline()
+                f.readline()
+                self.assertEqual(data, nsv.load(f))
+                self.assertEqual(b'', f.read())
+
+    def test_load_binary_gzip(self):
+        # Random cells so the compressed file itself is past the mmap threshold
+        rng = random.Random(0)
+        data = [[f'{rng.getrandbits(256):064x}', 'line\nbreak'] for _ in range(30000)]
+        with tempfile.TemporaryDirectory() as output_dir:
+            file_path = os.path.join(output_dir, 'large.nsv.gz')
+            with gzip.open(file_path, 'wt', encoding='utf-8') as f:
+                nsv.dump(data, f)
+            self.assertGreater(os.path.getsize(file_path), nsv.core._MMAP_THRESHOLD)
+            with gzip.open(file_path, 'rb') as f:
+                self.assertEqual(data, nsv.load(f))
+
+    def test_load_binary_tar_member(self):
+        for name, expected in SAMPLES_DATA.items():
+            with self.subTest(sample_name=name):
+                payload = SAMPLES_TEXT[name].encode('utf-8')
+                buffer = io.BytesIO()
+                with tarfile.open(fileobj=buffer, mode='w') as tar:
+                    info = tarfile.TarInfo(f'{name}.nsv')
+                    info.size = len(payload)
+                    tar.addfile(info, io.BytesIO(payload))
+                buffer.seek(0)
+                with tarfile.open(fileobj=buffer) as tar:
+                    self.assertEqual(expected, nsv.load(tar.extractfile(f'{name}.nsv')))
+
+    def test_loads_dict_encoded(self):
+        for name, expected in SAMPLES_DATA.items():
+            with self.subTest(sample_name=name):
+                codes, vocab = nsv.loads_dict_encoded(SAMPLES_TEXT[name])
+                self.assertEqual(len(vocab), len({cell for row in expected for cell in row}))
+                self.assertEqual(expected, [[vocab[code] for code in row] for row in codes])
+
+    def test_loads_dict_encoded_equivalent_escapes(self):
+        """Different escaped spellings of one value share a single vocab entry."""
+        codes, vocab = nsv.loads_dict_encoded('a\\x\na\\\\x\n\\\n\n\\\n\n')
+        self.assertEqual(['a\\x', ''], vocab)
+        self.assertEqual([[0, 0, 1], [1]], codes)
+
+    def test_parity(self):
+        for name, s in SAMPLES_TEXT.items():
+            with self.subTest(sample_name=name):
+                self.assertEqual(nsv.loads(s), nsv.load(StringIO(s)))
 
 
 if __name__ == '__main__':
@@ -37,6 +37,16 @@ SAMPLES_DATA = {
 }
 
 
+def _read_sample(name):
+    file_path = os.path.join(SAMPLES_DIR, f'{name}.nsv')
+    with open(file_path, 'r') as f:
+        return f.read()
+
+
+# Read once at import, for tests that only need the sample's text
+SAMPLES_TEXT = {name: _read_sample(name) for name in SAMPLES_DATA}
+
+
 def dump_then_load(data):
     return nsv.loads(nsv.dumps(data))
 
@@ -53,10 +63,7 @@ def load_sample(name):
 
 
 def loads_sample(name):
-    file_path = os.path.join(SAMPLES_DIR, f'{name}.nsv')
-    with open(file_path, 'r') as f:
-        data = nsv.loads(f.read())
-    return data
+    return nsv.loads(SAMPLES_TEXT[name])
 
 
 def dump_sample(name):